@@ -4,135 +4,124 @@ Automated Deployment Checker
 Takes a screenshot of the Vercel deployment to verify it's working
 """
 
-import time
-import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import asyncio
 import os
+import sys
 from datetime import datetime
+from verify._runner import check_all, close
 
 # Configuration
 URL = "https://frontand-app-v1-clean-50qt0bjx1-frontand-tech-persons-projects.vercel.app/flows/loop-over-rows"
 SCREENSHOT_PATH = "loop_over_rows_check.png"
 
-def check_url_status():
-    """Check if the URL is accessible"""
-    try:
-        response = requests.get(URL, timeout=10, allow_redirects=True)
-        print(f"✅ URL Status: {response.status_code}")
-        print(f"📍 Final URL: {response.url}")
-        print(f"📋 Headers: {dict(list(response.headers.items())[:5])}")  # First 5 headers
-        
-        if response.status_code == 401:
-            print("🔐 AUTHENTICATION REQUIRED!")
-            print("   This explains the blank page - Vercel has auth protection enabled")
-            return "auth_required"
-        elif response.status_code in [200, 301, 302]:
-            return True
-        else:
-            return False
-    except Exception as e:
-        print(f"❌ URL Error: {e}")
+def report_http(result):
+    """Report whether the URL is accessible"""
+    if result['status_code'] is None:
+        print(f"❌ URL Error: {result.get('http_error')}")
         return False
 
-def take_screenshot():
-    """Take a screenshot of the webpage"""
-    # Setup Chrome options
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run in background
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1280,720")
-    chrome_options.add_argument("--disable-web-security")  # For auth testing
-    
-    driver = None
-    try:
-        # Initialize Chrome driver
-        driver = webdriver.Chrome(options=chrome_options)
-        
-        print(f"🌐 Loading: {URL}")
-        driver.get(URL)
-        
-        # Wait for page to load
-        time.sleep(5)  # Longer wait for auth pages
-        
-        # Take screenshot regardless of content
-        driver.save_screenshot(SCREENSHOT_PATH)
-        print(f"📸 Screenshot saved: {SCREENSHOT_PATH}")
-        
-        # Get page title and some basic info
-        title = driver.title
-        print(f"📄 Page Title: {title}")
-        
-        # Get current URL (might be redirected)
-        current_url = driver.current_url
-        print(f"📍 Current URL: {current_url}")
-        
-        # Check for JavaScript console errors
-        logs = driver.get_log('browser')
-        if logs:
-            print("🚨 JavaScript Console Errors:")
-            for log in logs:
-                if log['level'] in ['SEVERE', 'ERROR']:
-                    print(f"   ❌ {log['level']}: {log['message']}")
-        else:
-            print("✅ No JavaScript console errors")
-        
-        # Check if page has content
-        try:
-            body_text = driver.find_element(By.TAG_NAME, "body").text
-            if body_text.strip():
-                print(f"✅ Page has content ({len(body_text)} characters)")
-                print(f"🔍 First 300 chars: {body_text[:300]}")
-            else:
-                print("❌ Page appears blank/empty")
-                
-            # Check for common auth elements
-            auth_indicators = ["sign in", "login", "password", "unauthorized", "access denied"]
-            for indicator in auth_indicators:
-                if indicator.lower() in body_text.lower():
-                    print(f"🔐 AUTH DETECTED: Found '{indicator}' in page content")
-                    
-        except Exception as e:
-            print(f"⚠️ Could not read page content: {e}")
-            
+    print(f"✅ URL Status: {result['status_code']}")
+    print(f"📍 Final URL: {result['final_url']}")
+    print(f"📋 Headers: {result['headers']}")
+
+    if result['status_code'] == 401:
+        print("🔐 AUTHENTICATION REQUIRED!")
+        print("   This explains the blank page - Vercel has auth protection enabled")
+        return "auth_required"
+    elif result['status_code'] in [200, 301, 302]:
         return True
-        
-    except Exception as e:
-        print(f"❌ Screenshot Error: {e}")
+    else:
         return False
-    finally:
-        if driver:
-            driver.quit()
 
-def main():
-    """Main function"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"\n🚀 Front& Deployment Check - {timestamp}")
-    print("=" * 50)
-    
+def report_browser(result):
+    """Report what the browser saw on the webpage"""
+    if 'browser_error' in result:
+        print(f"❌ Screenshot Error: {result['browser_error']}")
+        return False
+
+    if 'load_error' in result:
+        print(f"⚠️ Page did not finish loading: {result['load_error']}")
+
+    print(f"📸 Screenshot saved: {result['screenshot']}")
+
+    # Get page title and some basic info
+    print(f"📄 Page Title: {result['title']}")
+
+    # Get current URL (might be redirected)
+    print(f"📍 Current URL: {result['current_url']}")
+
+    # Check for JavaScript console errors
+    if result['console_errors']:
+        print("🚨 JavaScript Console Errors:")
+        for message in result['console_errors']:
+            print(f"   ❌ ERROR: {message}")
+    else:
+        print("✅ No JavaScript console errors")
+
+    # Check if page has content
+    body_text = result['body_text']
+    if body_text.strip():
+        print(f"✅ Page has content ({len(body_text)} characters)")
+        print(f"🔍 First 300 chars: {body_text[:300]}")
+    else:
+        print("❌ Page appears blank/empty")
+
+    # Check for common auth elements
+    auth_indicators = ["sign in", "login", "password", "unauthorized", "access denied"]
+    for indicator in auth_indicators:
+        if indicator.lower() in body_text.lower():
+            print(f"🔐 AUTH DETECTED: Found '{indicator}' in page content")
+
+    return True
+
+def report(result):
+    """Print the check results for one URL"""
+    print(f"\n🌐 Loaded: {result['url']}")
+
     # Check URL accessibility
-    status = check_url_status()
-    
+    status = report_http(result)
+
     if status == "auth_required":
         print("\n🔐 DIAGNOSIS: Vercel has authentication protection enabled!")
         print("   This is why the page appears blank - it's showing an auth challenge")
         print("   To fix: Disable Vercel authentication in project settings")
-        
+
     elif status == False:
-        print("\n❌ URL is not accessible, cannot take screenshot")
+        print("\n❌ URL is not accessible, skipping browser report")
+        if result.get('screenshot'):
+            print(f"   Screenshot of the failed load kept at '{result['screenshot']}'")
         return
-    
-    # Take screenshot anyway to see what's displayed
-    print("\n📸 Taking screenshot to see current state...")
-    if take_screenshot():
-        print(f"\n✅ Check complete! Screenshot saved as '{SCREENSHOT_PATH}'")
-        print(f"📁 Full path: {os.path.abspath(SCREENSHOT_PATH)}")
+
+    # Screenshot is taken anyway to see what's displayed
+    print("\n📸 Screenshot of current state...")
+    if report_browser(result):
+        print(f"\n✅ Check complete! Screenshot saved as '{result['screenshot']}'")
+        print(f"📁 Full path: {os.path.abspath(result['screenshot'])}")
     else:
         print("\n❌ Failed to take screenshot")
 
+async def run(urls):
+    """Check every URL concurrently"""
+    if len(urls) == 1:
+        screenshots = [SCREENSHOT_PATH]
+    else:
+        base, ext = os.path.splitext(SCREENSHOT_PATH)
+        screenshots = [f"{base}_{i}{ext}" for i in range(1, len(urls) + 1)]
+    try:
+        return await check_all(urls, screenshots=screenshots, viewport=(1280, 720))
+    finally:
+        await close()
+
+def main():
+    """Main function"""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    print(f"\n🚀 Front& Deployment Check - {timestamp}")
+    print("=" * 50)
+
+    # Extra deployments can be passed on the command line
+    urls = sys.argv[1:] or [URL]
+    for result in asyncio.run(run(urls)):
+        report(result)
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
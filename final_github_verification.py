@@ -1,54 +1,32 @@
 #!/usr/bin/env python3
 import time
-import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+from verify._runner import run_one, DEFAULT_URL
 
 # The new GitHub-connected production deployment
-url = "https://frontand-app-v1-clean-50qt0bjx1-frontand-tech-persons-projects.vercel.app/flows/loop-over-rows"
+url = DEFAULT_URL
 
 print(f"🔍 FINAL GitHub-Connected Verification: {url}")
 
-# HTTP check
-response = requests.get(url, timeout=10)
-print(f"🌐 HTTP Status: {response.status_code}")
-
-# Browser check
-chrome_options = Options()
-chrome_options.add_argument("--headless")
-chrome_options.add_argument("--no-sandbox")
-chrome_options.add_argument("--window-size=1920,1080")
-
-driver = webdriver.Chrome(options=chrome_options)
-try:
-    driver.get(url)
-    time.sleep(8)
-    
-    timestamp = int(time.time())
-    screenshot_name = f"GITHUB_CONNECTED_{timestamp}.png"
-    driver.save_screenshot(screenshot_name)
-    print(f"📸 Screenshot: {screenshot_name}")
-    
-    # Check Google Search toggle
-    try:
-        toggle = driver.find_element(By.ID, "google-search")
-        print("✅ Google Search toggle: FOUND!")
-    except:
-        print("❌ Google Search toggle: NOT FOUND")
-    
-    # Check for clean version (no legacy)
-    page_text = driver.find_element(By.TAG_NAME, "body").text
-    legacy_items = ['Dashboard', 'Flow Library', 'Creators', 'Featured Workflows']
-    found_legacy = [item for item in legacy_items if item in page_text]
-    
-    if found_legacy:
-        print(f"⚠️ Found legacy items: {found_legacy}")
-    else:
-        print("✅ NO LEGACY FEATURES - 100% CLEAN!")
-        
-finally:
-    driver.quit()
+page = run_one(url, selector_id="google-search", screenshot=f"GITHUB_CONNECTED_{int(time.time())}.png")
+print(f"🌐 HTTP Status: {page['status_code']}")
+
+if 'browser_error' in page:
+    print(f"❌ Browser check failed: {page['browser_error']}")
+    exit(1)
+
+print(f"📸 Screenshot: {page['screenshot']}")
+
+# Check Google Search toggle
+if page['selector_found']:
+    print("✅ Google Search toggle: FOUND!")
+else:
+    print("❌ Google Search toggle: NOT FOUND")
+
+# Check for clean version (no legacy)
+if page['legacy_items']:
+    print(f"⚠️ Found legacy items: {page['legacy_items']}")
+else:
+    print("✅ NO LEGACY FEATURES - 100% CLEAN!")
 
 print(f"\n🎯 FINAL GITHUB-CONNECTED SUMMARY:")
 print(f"✅ Repository: frontand-app/frontand-app-v1-230725")
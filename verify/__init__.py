@@ -0,0 +1 @@
+"""Shared helpers for the Front& deployment verification scripts."""
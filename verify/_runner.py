@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Deployment Verification Runner
+One headless Chromium shared by every check, element-triggered waits instead of fixed sleeps
+
+Requires: pip install playwright httpx && playwright install chromium
+"""
+
+import asyncio
+import httpx
+from playwright.async_api import async_playwright, Error as PlaywrightError
+
+# Configuration
+DEFAULT_URL = "https://frontand-app-v1-clean-50qt0bjx1-frontand-tech-persons-projects.vercel.app/flows/loop-over-rows"
+WAIT_TIMEOUT_MS = 10000
+HTTP_TIMEOUT = 10
+MAX_CONCURRENT_CHECKS = 4
+LEGACY_ITEMS = ['Dashboard', 'Flow Library', 'Creators', 'Featured Workflows']
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-web-security",  # For auth testing
+]
+BLOCKED_RESOURCES = {"image"}  # Checks only read title, text and the toggle
+
+_playwright = None
+_browser = None
+_http = None
+_launch_lock = asyncio.Lock()
+
+
+async def _get_browser():
+    """Launch Chromium once and reuse it across checks"""
+    global _playwright, _browser
+    async with _launch_lock:
+        if _browser is None:
+            _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+    return _browser
+
+
+def _get_http():
+    """Create the shared HTTP client on first use"""
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(timeout=HTTP_TIMEOUT, follow_redirects=True)
+    return _http
+
+
+async def close():
+    """Shut down the shared browser and HTTP client"""
+    global _playwright, _browser, _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+async def probe(url):
+    """Plain HTTP request to the deployment, no browser"""
+    try:
+        response = await _get_http().get(url)
+        return {
+            "status_code": response.status_code,
+            "final_url": str(response.url),
+            "headers": dict(list(response.headers.items())[:5]),  # First 5 headers
+        }
+    except Exception as e:
+        return {"status_code": None, "http_error": str(e)}
+
+
+async def load(url, selector_id=None, screenshot=None, viewport=(1920, 1080)):
+    """Load a page in the shared browser and collect what the verify scripts report"""
+    try:
+        browser = await _get_browser()
+        page = await browser.new_page(viewport={"width": viewport[0], "height": viewport[1]})
+    except Exception as e:
+        return {"selector_id": selector_id, "selector_found": None, "label": None, "browser_error": str(e)}
+
+    console_errors = []
+    blocked_urls = set()
+
+    async def block_images(route):
+        """Skip downloads the checks never look at"""
+        if route.request.resource_type in BLOCKED_RESOURCES:
+            blocked_urls.add(route.request.url)
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def record_console(msg):
+        # Aborted requests log "Failed to load resource", which is not a page error
+        if msg.type == "error" and msg.location.get("url") not in blocked_urls:
+            console_errors.append(msg.text)
+
+    page.on("console", record_console)
+    # Uncaught exceptions only arrive as pageerror, Selenium's get_log('browser') had them as SEVERE
+    page.on("pageerror", lambda exc: console_errors.append(str(exc)))
+    await page.route("**/*", block_images)
+
+    result = {"selector_id": selector_id, "selector_found": None, "label": None}
+    try:
+        # Equivalent of Selenium's "eager" strategy: return on DOMContentLoaded
+        await page.goto(url, wait_until="domcontentloaded")
+
+        # Without a target element, wait for the document itself to finish loading
+        if not selector_id:
+            try:
+                await page.wait_for_function("document.readyState === 'complete'", timeout=WAIT_TIMEOUT_MS)
+            except PlaywrightError as e:
+                # Slow or stuck pages are exactly what the screenshot is for
+                result["load_error"] = str(e)
+
+        # Return as soon as the element exists instead of sleeping a fixed time
+        if selector_id:
+            try:
+                await page.wait_for_selector(f"#{selector_id}", state="attached", timeout=WAIT_TIMEOUT_MS)
+                result["selector_found"] = True
+                label = await page.query_selector(f"label[for='{selector_id}']")
+                if label:
+                    result["label"] = (await label.inner_text()).strip()
+            except PlaywrightError as e:
+                result["selector_found"] = False
+                result["selector_error"] = str(e)
+
+        if screenshot:
+            await page.screenshot(path=screenshot)
+            result["screenshot"] = screenshot
+
+        body_text = await page.inner_text("body")
+        result.update({
+            "title": await page.title(),
+            "current_url": page.url,
+            "body_text": body_text,
+            "legacy_items": [item for item in LEGACY_ITEMS if item in body_text],
+            "console_errors": console_errors,
+        })
+    except PlaywrightError as e:
+        result["browser_error"] = str(e)
+    finally:
+        await page.close()
+
+    return result
+
+
+async def check(url, **kwargs):
+    """HTTP probe and browser load for one URL, run concurrently"""
+    http_result, page_result = await asyncio.gather(probe(url), load(url, **kwargs))
+    return {"url": url, **http_result, **page_result}
+
+
+async def check_all(urls, screenshots=None, **kwargs):
+    """Check many URLs at once, at most MAX_CONCURRENT_CHECKS in flight"""
+    sem = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+    screenshots = screenshots or [None] * len(urls)
+
+    async def bounded(url, screenshot):
+        async with sem:
+            return await check(url, screenshot=screenshot, **kwargs)
+
+    results = await asyncio.gather(*[bounded(u, s) for u, s in zip(urls, screenshots)], return_exceptions=True)
+
+    # One broken URL should not throw away the results for the others
+    return [
+        {"url": u, "status_code": None, "http_error": str(r), "browser_error": str(r)}
+        if isinstance(r, Exception) else r
+        for u, r in zip(urls, results)
+    ]
+
+
+def run_one(url, screenshot=None, **kwargs):
+    """Blocking entry point for the single-URL verify scripts"""
+    async def main():
+        try:
+            results = await check_all([url], screenshots=[screenshot], **kwargs)
+            return results[0]
+        finally:
+            await close()
+
+    return asyncio.run(main())
@@ -1,52 +1,33 @@
 #!/usr/bin/env python3
 import time
-import requests
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
+from verify._runner import run_one, DEFAULT_URL
 
-url = "https://frontand-app-v1-clean-50qt0bjx1-frontand-tech-persons-projects.vercel.app/flows/loop-over-rows"
+url = DEFAULT_URL
 
 print(f"🔍 Verifying CLEAN deployment: {url}")
 
-try:
-    response = requests.get(url, timeout=10)
-    print(f"🌐 HTTP Status: {response.status_code}")
-    
-    if response.status_code != 200:
-        print("❌ URL not accessible")
-        exit(1)
-        
-except Exception as e:
-    print(f"❌ Request failed: {e}")
+page = run_one(url, selector_id="google-search", screenshot=f"CLEAN_WORKING_{int(time.time())}.png")
+
+if page['status_code'] is None:
+    print(f"❌ Request failed: {page['http_error']}")
+    exit(1)
+
+print(f"🌐 HTTP Status: {page['status_code']}")
+
+if page['status_code'] != 200:
+    print("❌ URL not accessible")
     exit(1)
 
-chrome_options = Options()
-chrome_options.add_argument("--headless")
-chrome_options.add_argument("--no-sandbox")
-chrome_options.add_argument("--window-size=1920,1080")
-
-driver = webdriver.Chrome(options=chrome_options)
-try:
-    driver.get(url)
-    time.sleep(8)
-    
-    timestamp = int(time.time())
-    screenshot_name = f"CLEAN_WORKING_{timestamp}.png"
-    driver.save_screenshot(screenshot_name)
-    print(f"📸 Screenshot: {screenshot_name}")
-    
-    try:
-        toggle = driver.find_element(By.ID, "google-search")
-        print("✅ Google Search toggle: FOUND!")
-        
-        label = driver.find_element(By.XPATH, "//label[@for='google-search']")
-        print(f"🏷️ Label: '{label.text.strip()}'")
-        
-    except Exception as e:
-        print(f"❌ Google Search toggle: NOT FOUND - {e}")
-        
-finally:
-    driver.quit()
+if 'browser_error' in page:
+    print(f"❌ Browser check failed: {page['browser_error']}")
+    exit(1)
+
+print(f"📸 Screenshot: {page['screenshot']}")
+
+if page['selector_found']:
+    print("✅ Google Search toggle: FOUND!")
+    print(f"🏷️ Label: '{page['label']}'")
+else:
+    print(f"❌ Google Search toggle: NOT FOUND - {page.get('selector_error')}")
 
 print(f"\n✅ Clean deployment verified!")